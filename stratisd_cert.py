@@ -328,9 +328,10 @@ class StratisdCertify(
         with NamedTemporaryFile(mode="w") as temp_file:
             temp_file.write("test-password")
             temp_file.flush()
+            temp_file.seek(0)
 
             self._unittest_command(
-                StratisDbus.set_key(key_desc, temp_file), dbus.UInt16(0)
+                StratisDbus.set_key(key_desc, temp_file.fileno()), dbus.UInt16(0)
             )
 
         self._unittest_command(StratisDbus.unset_key(key_desc), dbus.UInt16(0))
@@ -349,8 +350,9 @@ class StratisdCertify(
             with NamedTemporaryFile(mode="w") as temp_file:
                 temp_file.write("test-password")
                 temp_file.flush()
+                temp_file.seek(0)
 
-                StratisDbus.set_key(key_desc, temp_file)
+                StratisDbus.set_key(key_desc, temp_file.fileno())
 
         self._test_permissions(set_key, [], True)
 
@@ -16,6 +16,8 @@ DBus methods for blackbox testing.
 """
 # isort: STDLIB
 import os
+from contextlib import contextmanager
+from functools import lru_cache
 
 # isort: THIRDPARTY
 import dbus
@@ -41,14 +43,59 @@ def fs_n():
     return _TEST_PREF + "fs" + random_string()
 
 
+@lru_cache(maxsize=None)
 def manager_interfaces(revision_number):
     """
-    Return a list of manager interfaces from 0 to revision_number - 1.
+    Return the manager interfaces from 0 to revision_number - 1.
     :param int revision_number: highest D-Bus interface number
-    :rtype: list of str
+    :rtype: tuple of str
     """
     interface_prefix = f"{StratisDbus.BUS_NAME}.Manager"
-    return [f"{interface_prefix}.r{rn}" for rn in range(revision_number)]
+    return tuple(f"{interface_prefix}.r{rn}" for rn in range(revision_number))
+
+
+def test_objects(objects, interface_name):
+    """
+    Select the objects in a GetManagedObjects result that implement the given
+    interface and whose name marks them as made by these tests.
+    :param dict objects: the result of a GetManagedObjects call
+    :param str interface_name: the interface name
+    :return: the object paths and the properties of the given interface
+    :rtype: generator of str * dict
+    """
+    for path, obj_data in objects.items():
+        props = obj_data.get(interface_name)
+        if props is None:
+            continue
+        if props["Name"].startswith(_TEST_PREF):
+            yield (path, props)
+
+
+def _pool_paths_by_name(objects):
+    """
+    Index the test pools in a GetManagedObjects result by name.
+    :param dict objects: the result of a GetManagedObjects call
+    :return: map of pool name to pool object path
+    :rtype: dict of str * str
+    """
+    return {
+        props["Name"]: path
+        for path, props in test_objects(objects, StratisDbus.POOL_IFACE)
+    }
+
+
+def _fs_paths_by_name(objects):
+    """
+    Index the test filesystems in a GetManagedObjects result by pool object
+    path and filesystem name.
+    :param dict objects: the result of a GetManagedObjects call
+    :return: map of pool object path and filesystem name to filesystem path
+    :rtype: dict of (str * str) * str
+    """
+    return {
+        (props["Pool"], props["Name"]): path
+        for path, props in test_objects(objects, StratisDbus.FS_IFACE)
+    }
 
 
 # This function is an exact copy of the get_timeout function in
@@ -103,7 +150,7 @@ class StratisDbus:
     "Wrappers around stratisd DBus calls"
 
     _OBJECT_MANAGER = "org.freedesktop.DBus.ObjectManager"
-    _BUS = dbus.SystemBus()
+    _BUS = dbus.SystemBus(private=True)
     _BUS_NAME = "org.storage.stratis3"
     _TOP_OBJECT = "/org/storage/stratis3"
     REVISION_NUMBER = 8
@@ -126,6 +173,95 @@ class StratisDbus:
         os.environ.get("STRATIS_DBUS_TIMEOUT", _DBUS_TIMEOUT_SECONDS * 1000)
     )
 
+    _managed_objects_cache = None
+    _owner = None
+    _proxies = {}
+    _interfaces = {}
+
+    @staticmethod
+    def _check_owner():
+        """
+        Drop the cached proxies and interfaces if the owner of the stratisd
+        bus name has changed since they were made, as happens whenever
+        stratisd is restarted. Each proxy is bound to the owner at the time
+        it was made.
+        """
+        try:
+            owner = StratisDbus._BUS.get_name_owner(StratisDbus._BUS_NAME)
+        except dbus.exceptions.DBusException:
+            owner = None
+
+        if owner != StratisDbus._owner:
+            StratisDbus._proxies = {}
+            StratisDbus._interfaces = {}
+            StratisDbus._owner = owner
+
+    @staticmethod
+    def _proxy(object_path, *, introspect=True):
+        """
+        Get a proxy for a stratisd object, reusing the proxy made by an
+        earlier call when there is one, so that each object is introspected
+        at most once.
+
+        Only call this through _interface(), which ensures that no proxy
+        bound to a previous owner of the stratisd bus name is reused.
+
+        :param str object_path: the object path
+        :param bool introspect: whether to introspect the object
+        :rtype: dbus.proxies.ProxyObject
+        """
+        key = (object_path, introspect)
+        proxy = StratisDbus._proxies.get(key)
+        if proxy is None:
+            proxy = StratisDbus._BUS.get_object(
+                StratisDbus._BUS_NAME, object_path, introspect=introspect
+            )
+            StratisDbus._proxies[key] = proxy
+        return proxy
+
+    @staticmethod
+    def _interface(object_path, interface_name, *, introspect=True):
+        """
+        Get an interface on a stratisd object, reusing the dbus.Interface
+        made by an earlier call when there is one.
+
+        Without introspection, argument types are guessed from the Python
+        values passed, so only set introspect to False for methods which
+        take no arguments or only string arguments.
+
+        :param str object_path: the object path
+        :param str interface_name: the interface name
+        :param bool introspect: whether to introspect the object
+        :rtype: dbus.Interface
+        """
+        StratisDbus._check_owner()
+
+        key = (object_path, interface_name, introspect)
+        iface = StratisDbus._interfaces.get(key)
+        if iface is None:
+            iface = dbus.Interface(
+                StratisDbus._proxy(object_path, introspect=introspect),
+                interface_name,
+            )
+            StratisDbus._interfaces[key] = iface
+        return iface
+
+    @staticmethod
+    @contextmanager
+    def cached_managed_objects():
+        """
+        Fetch the managed objects once and serve every get_managed_objects
+        call made inside the with block from that single result.
+
+        Only use this around a sequence of operations which do not depend on
+        seeing each other's changes to the object tree.
+        """
+        StratisDbus._managed_objects_cache = StratisDbus.get_managed_objects()
+        try:
+            yield StratisDbus._managed_objects_cache
+        finally:
+            StratisDbus._managed_objects_cache = None
+
     @staticmethod
     def get_managed_objects():
         """
@@ -134,12 +270,30 @@ class StratisDbus:
                           names mapped to property dicts.
                           Property dicts map names to values.
         """
-        object_manager = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, StratisDbus._TOP_OBJECT),
-            StratisDbus._OBJECT_MANAGER,
+        if StratisDbus._managed_objects_cache is not None:
+            return StratisDbus._managed_objects_cache
+
+        object_manager = StratisDbus._interface(
+            StratisDbus._TOP_OBJECT, StratisDbus._OBJECT_MANAGER, introspect=False
         )
         return object_manager.GetManagedObjects(timeout=StratisDbus._TIMEOUT)
 
+    @staticmethod
+    def _get_property(object_path, interface_name, property_name):
+        """
+        Get a single property of a stratisd object, without fetching the
+        whole object tree.
+
+        :param str object_path: the object path
+        :param str interface_name: the interface which has the property
+        :param str property_name: the property name
+        :return: the property value
+        """
+        iface = StratisDbus._interface(
+            object_path, dbus.PROPERTIES_IFACE, introspect=False
+        )
+        return iface.Get(interface_name, property_name, timeout=StratisDbus._TIMEOUT)
+
     @staticmethod
     def stratisd_version():
         """
@@ -147,12 +301,8 @@ class StratisDbus:
         :return: The current stratisd version
         :rtype: str
         """
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, StratisDbus._TOP_OBJECT),
-            dbus.PROPERTIES_IFACE,
-        )
-        return iface.Get(
-            StratisDbus._MNGR_IFACE, "Version", timeout=StratisDbus._TIMEOUT
+        return StratisDbus._get_property(
+            StratisDbus._TOP_OBJECT, StratisDbus._MNGR_IFACE, "Version"
         )
 
     @staticmethod
@@ -162,12 +312,8 @@ class StratisDbus:
         :return: The current list of stopped pools
         :rtype: str
         """
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, StratisDbus._TOP_OBJECT),
-            dbus.PROPERTIES_IFACE,
-        )
-        return iface.Get(
-            StratisDbus._MNGR_IFACE, "StoppedPools", timeout=StratisDbus._TIMEOUT
+        return StratisDbus._get_property(
+            StratisDbus._TOP_OBJECT, StratisDbus._MNGR_IFACE, "StoppedPools"
         )
 
     @staticmethod
@@ -177,16 +323,11 @@ class StratisDbus:
         :return: A list of object paths, names, and UUIDs
         :rtype: List of str * str * str
         """
-        pool_objects = [
-            (obj_path, obj_data[StratisDbus._POOL_IFACE])
-            for obj_path, obj_data in StratisDbus.get_managed_objects().items()
-            if StratisDbus._POOL_IFACE in obj_data
-            and obj_data[StratisDbus._POOL_IFACE]["Name"].startswith(_TEST_PREF)
-        ]
-
         return [
             (obj_path, pool_obj["Name"], pool_obj["Uuid"])
-            for obj_path, pool_obj in pool_objects
+            for obj_path, pool_obj in test_objects(
+                StratisDbus.get_managed_objects(), StratisDbus._POOL_IFACE
+            )
         ]
 
     @staticmethod
@@ -196,38 +337,32 @@ class StratisDbus:
         :return: A list of blockdev names
         :rtype: List of str
         """
-        blockdev_objects = [
-            obj_data[StratisDbus._BLKDEV_IFACE]
-            for _, obj_data in StratisDbus.get_managed_objects().items()
-            if StratisDbus._BLKDEV_IFACE in obj_data
-            and obj_data[StratisDbus._BLKDEV_IFACE]["Name"].startswith(_TEST_PREF)
+        return [
+            blockdev_obj["Name"]
+            for _, blockdev_obj in test_objects(
+                StratisDbus.get_managed_objects(), StratisDbus._BLKDEV_IFACE
+            )
         ]
 
-        return [blockdev_obj["Name"] for blockdev_obj in blockdev_objects]
-
     @staticmethod
-    def set_key(key_desc, temp_file):
+    def set_key(key_desc, key_fd):
         """
         Set a key
         :param str key_desc: The key description
-        :param temp_file:
+        :param int key_fd: A file descriptor from which to read the key data
         """
-        manager_iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, StratisDbus._TOP_OBJECT),
-            StratisDbus._MNGR_IFACE,
+        manager_iface = StratisDbus._interface(
+            StratisDbus._TOP_OBJECT, StratisDbus._MNGR_IFACE
         )
-
-        with open(temp_file.name, "r", encoding="utf-8") as fd_for_dbus:
-            return manager_iface.SetKey(key_desc, fd_for_dbus.fileno())
+        return manager_iface.SetKey(key_desc, key_fd)
 
     @staticmethod
     def unset_key(key_desc):
         """
         Unset a key
         """
-        manager_iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, StratisDbus._TOP_OBJECT),
-            StratisDbus._MNGR_IFACE,
+        manager_iface = StratisDbus._interface(
+            StratisDbus._TOP_OBJECT, StratisDbus._MNGR_IFACE
         )
 
         return manager_iface.UnsetKey(key_desc)
@@ -241,10 +376,7 @@ class StratisDbus:
         :return: The return values of the ListKeys call
         :rtype: The D-Bus types as, q, and s
         """
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, StratisDbus._TOP_OBJECT),
-            StratisDbus._MNGR_IFACE,
-        )
+        iface = StratisDbus._interface(StratisDbus._TOP_OBJECT, StratisDbus._MNGR_IFACE)
         return iface.ListKeys(timeout=StratisDbus._TIMEOUT)
 
     @staticmethod
@@ -254,9 +386,8 @@ class StratisDbus:
         :param str id: The identifier of the pool to start
         :param str type: The type of identifier ("uuid" or "name")
         """
-        manager_iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, StratisDbus._TOP_OBJECT),
-            StratisDbus._MNGR_IFACE,
+        manager_iface = StratisDbus._interface(
+            StratisDbus._TOP_OBJECT, StratisDbus._MNGR_IFACE
         )
 
         return manager_iface.StartPool(id_string, id_type, (False, ""), (False, 0))
@@ -266,9 +397,8 @@ class StratisDbus:
         """
         Stop a pool
         """
-        manager_iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, StratisDbus._TOP_OBJECT),
-            StratisDbus._MNGR_IFACE,
+        manager_iface = StratisDbus._interface(
+            StratisDbus._TOP_OBJECT, StratisDbus._MNGR_IFACE
         )
 
         return manager_iface.StopPool(id_string, id_type)
@@ -278,25 +408,15 @@ class StratisDbus:
         """
         Find a pool UUID given an object path.
         """
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, pool_path),
-            dbus.PROPERTIES_IFACE,
-        )
-
-        return iface.Get(StratisDbus._POOL_IFACE, "Uuid", timeout=StratisDbus._TIMEOUT)
+        return StratisDbus._get_property(pool_path, StratisDbus._POOL_IFACE, "Uuid")
 
     @staticmethod
     def pool_encrypted(pool_path):
         """
         Find a pool Encrypted value given an object path.
         """
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, pool_path),
-            dbus.PROPERTIES_IFACE,
-        )
-
-        return iface.Get(
-            StratisDbus._POOL_IFACE, "Encrypted", timeout=StratisDbus._TIMEOUT
+        return StratisDbus._get_property(
+            pool_path, StratisDbus._POOL_IFACE, "Encrypted"
         )
 
     @staticmethod
@@ -318,10 +438,7 @@ class StratisDbus:
         :return: The return values of the CreatePool call
         :rtype: The D-Bus types (b(oao)), q, and s
         """
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, StratisDbus._TOP_OBJECT),
-            StratisDbus._MNGR_IFACE,
-        )
+        iface = StratisDbus._interface(StratisDbus._TOP_OBJECT, StratisDbus._MNGR_IFACE)
         return iface.CreatePool(
             pool_name,
             devices,
@@ -341,26 +458,31 @@ class StratisDbus:
         :return: The object path of the DestroyPool call, or None
         :rtype: The D-Bus types (bs), q, and s, or None
         """
-        pool_objects = {
-            path: obj_data[StratisDbus._POOL_IFACE]
-            for path, obj_data in StratisDbus.get_managed_objects().items()
-            if StratisDbus._POOL_IFACE in obj_data
-            and obj_data[StratisDbus._POOL_IFACE]["Name"].startswith(_TEST_PREF)
-        }
+        return StratisDbus.pool_destroy_many([pool_name])[pool_name]
 
-        pool_paths = [
-            path
-            for path, pool_obj in pool_objects.items()
-            if pool_obj["Name"] == pool_name
-        ]
-        if len(pool_paths) != 1:
-            return None
+    @staticmethod
+    def pool_destroy_many(pool_names):
+        """
+        Destroy several pools, finding all their object paths with a single
+        GetManagedObjects call
+        :param pool_names: The names of the pools to destroy
+        :type pool_names: list of str
+        :return: The return values of each DestroyPool call, or None, by name
+        :rtype: dict of str * (The D-Bus types (bs), q, and s, or None)
+        """
+        pool_paths = _pool_paths_by_name(StratisDbus.get_managed_objects())
 
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, StratisDbus._TOP_OBJECT),
-            StratisDbus._MNGR_IFACE,
-        )
-        return iface.DestroyPool(pool_paths[0], timeout=StratisDbus._TIMEOUT)
+        iface = StratisDbus._interface(StratisDbus._TOP_OBJECT, StratisDbus._MNGR_IFACE)
+
+        results = {}
+        for pool_name in pool_names:
+            pool_path = pool_paths.get(pool_name)
+            results[pool_name] = (
+                None
+                if pool_path is None
+                else iface.DestroyPool(pool_path, timeout=StratisDbus._TIMEOUT)
+            )
+        return results
 
     @staticmethod
     def fs_list():
@@ -370,21 +492,16 @@ class StratisDbus:
                  and the origin D-Bus; the value being the pool name
         :rtype: A dict of str * str * tuple -> str
         """
-        objects = StratisDbus.get_managed_objects().items()
-
-        fs_objects = [
-            (obj_path, obj_data[StratisDbus._FS_IFACE])
-            for obj_path, obj_data in objects
-            if StratisDbus._FS_IFACE in obj_data
-            and obj_data[StratisDbus._FS_IFACE]["Name"].startswith(_TEST_PREF)
-        ]
+        fs_objects = []
+        pool_path_to_name = {}
+        for obj_path, obj_data in StratisDbus.get_managed_objects().items():
+            pool_obj = obj_data.get(StratisDbus._POOL_IFACE)
+            if pool_obj is not None and pool_obj["Name"].startswith(_TEST_PREF):
+                pool_path_to_name[obj_path] = pool_obj["Name"]
 
-        pool_path_to_name = {
-            obj: obj_data[StratisDbus._POOL_IFACE]["Name"]
-            for obj, obj_data in objects
-            if StratisDbus._POOL_IFACE in obj_data
-            and obj_data[StratisDbus._POOL_IFACE]["Name"].startswith(_TEST_PREF)
-        }
+            fs_object = obj_data.get(StratisDbus._FS_IFACE)
+            if fs_object is not None and fs_object["Name"].startswith(_TEST_PREF):
+                fs_objects.append((obj_path, fs_object))
 
         return {
             (obj_path, fs_object["Name"], fs_object["Origin"]): pool_path_to_name[
@@ -402,10 +519,7 @@ class StratisDbus:
         :return: The return values of the InitCache call
         :rtype: The D-Bus types (bao), q, and s
         """
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, pool_path),
-            StratisDbus._POOL_IFACE,
-        )
+        iface = StratisDbus._interface(pool_path, StratisDbus._POOL_IFACE)
         return iface.InitCache(devices, timeout=StratisDbus._TIMEOUT)
 
     @staticmethod
@@ -417,10 +531,7 @@ class StratisDbus:
         :return: The return values of the AddCacheDevs call
         :rtype: The D-Bus types (bao), q, and s
         """
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, pool_path),
-            StratisDbus._POOL_IFACE,
-        )
+        iface = StratisDbus._interface(pool_path, StratisDbus._POOL_IFACE)
         return iface.AddCacheDevs(devices, timeout=StratisDbus._TIMEOUT)
 
     @staticmethod
@@ -432,10 +543,7 @@ class StratisDbus:
         :return: The return values of the AddCacheDevs call
         :rtype: The D-Bus types (bao), q, and s
         """
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, pool_path),
-            StratisDbus._POOL_IFACE,
-        )
+        iface = StratisDbus._interface(pool_path, StratisDbus._POOL_IFACE)
         return iface.AddDataDevs(devices, timeout=StratisDbus._TIMEOUT)
 
     @staticmethod
@@ -447,27 +555,13 @@ class StratisDbus:
         :return: The return values of the SetName call, or None
         :rtype: The D-Bus types (bs), q, and s, or None
         """
-        objects = StratisDbus.get_managed_objects().items()
-
-        pool_objects = {
-            path: obj_data[StratisDbus._POOL_IFACE]
-            for path, obj_data in objects
-            if StratisDbus._POOL_IFACE in obj_data
-            and obj_data[StratisDbus._POOL_IFACE]["Name"].startswith(_TEST_PREF)
-        }
-
-        pool_paths = [
-            path
-            for path, pool_obj in pool_objects.items()
-            if pool_obj["Name"] == pool_name
-        ]
-        if len(pool_paths) != 1:
+        pool_path = _pool_paths_by_name(StratisDbus.get_managed_objects()).get(
+            pool_name
+        )
+        if pool_path is None:
             return None
 
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, pool_paths[0]),
-            StratisDbus._POOL_IFACE,
-        )
+        iface = StratisDbus._interface(pool_path, StratisDbus._POOL_IFACE)
         return iface.SetName(pool_name_rename, timeout=StratisDbus._TIMEOUT)
 
     @staticmethod
@@ -480,10 +574,7 @@ class StratisDbus:
         :return: None
         :raises dbus.exceptions.DBusException:
         """
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, object_path),
-            dbus.PROPERTIES_IFACE,
-        )
+        iface = StratisDbus._interface(object_path, dbus.PROPERTIES_IFACE)
 
         return iface.Set(
             param_iface,
@@ -502,10 +593,7 @@ class StratisDbus:
         :rtype: The D-Bus types s, q, and s
         :raises dbus.exceptions.DBusException:
         """
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, pool_path),
-            StratisDbus._POOL_IFACE,
-        )
+        iface = StratisDbus._interface(pool_path, StratisDbus._POOL_IFACE)
         return iface.Metadata(current, timeout=StratisDbus._TIMEOUT)
 
     @staticmethod
@@ -519,10 +607,7 @@ class StratisDbus:
         :rtype: The D-Bus types s, q, and s
         :raises dbus.exceptions.DBusException:
         """
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, pool_path),
-            StratisDbus._POOL_IFACE,
-        )
+        iface = StratisDbus._interface(pool_path, StratisDbus._POOL_IFACE)
 
         return iface.FilesystemMetadata(
             (False, "") if fs_name is None else (True, fs_name),
@@ -542,18 +627,30 @@ class StratisDbus:
         :return: The return values of the CreateFilesystems call
         :rtype: The D-Bus types (ba(os)), q, and s
         """
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, pool_path),
-            StratisDbus._POOL_IFACE,
-        )
+        return StratisDbus.fs_create_many(pool_path, [(fs_name, fs_size, fs_sizelimit)])
 
-        file_spec = (
-            fs_name,
-            (False, "") if fs_size is None else (True, fs_size),
-            (False, "") if fs_sizelimit is None else (True, fs_sizelimit),
-        )
+    @staticmethod
+    def fs_create_many(pool_path, fs_specs):
+        """
+        Create several filesystems in a pool with a single call
+        :param str pool_path: The object path of the pool in which the filesystems will be created
+        :param fs_specs: The name, size, and size limit of each filesystem
+        :type fs_specs: list of str * (str or NoneType) * (str or NoneType)
+        :return: The return values of the CreateFilesystems call
+        :rtype: The D-Bus types (ba(os)), q, and s
+        """
+        iface = StratisDbus._interface(pool_path, StratisDbus._POOL_IFACE)
+
+        file_specs = [
+            (
+                fs_name,
+                (False, "") if fs_size is None else (True, fs_size),
+                (False, "") if fs_sizelimit is None else (True, fs_sizelimit),
+            )
+            for fs_name, fs_size, fs_sizelimit in fs_specs
+        ]
 
-        return iface.CreateFilesystems([file_spec], timeout=StratisDbus._TIMEOUT)
+        return iface.CreateFilesystems(file_specs, timeout=StratisDbus._TIMEOUT)
 
     @staticmethod
     def fs_destroy(pool_name, fs_name):
@@ -564,43 +661,29 @@ class StratisDbus:
         :return: The return values of the DestroyFilesystems call, or None
         :rtype: The D-Bus types (bas), q, and s, or None
         """
-        objects = StratisDbus.get_managed_objects().items()
-
-        pool_objects = {
-            path: obj_data[StratisDbus._POOL_IFACE]
-            for path, obj_data in objects
-            if StratisDbus._POOL_IFACE in obj_data
-            and obj_data[StratisDbus._POOL_IFACE]["Name"].startswith(_TEST_PREF)
-        }
-        fs_objects = {
-            path: obj_data[StratisDbus._FS_IFACE]
-            for path, obj_data in objects
-            if StratisDbus._FS_IFACE in obj_data
-            and obj_data[StratisDbus._FS_IFACE]["Name"].startswith(_TEST_PREF)
-        }
+        objects = StratisDbus.get_managed_objects()
 
-        pool_paths = [
-            path
-            for path, pool_obj in pool_objects.items()
-            if pool_obj["Name"] == pool_name
-        ]
-        if len(pool_paths) != 1:
+        pool_path = _pool_paths_by_name(objects).get(pool_name)
+        if pool_path is None:
             return None
 
-        pool_path = pool_paths[0]
-
-        fs_paths = [
-            path
-            for path, fs_obj in fs_objects.items()
-            if fs_obj["Name"] == fs_name and fs_obj["Pool"] == pool_path
-        ]
-        if len(fs_paths) != 1:
+        fs_path = _fs_paths_by_name(objects).get((pool_path, fs_name))
+        if fs_path is None:
             return None
 
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, pool_path),
-            StratisDbus._POOL_IFACE,
-        )
+        return StratisDbus.fs_destroy_many(pool_path, [fs_path])
+
+    @staticmethod
+    def fs_destroy_many(pool_path, fs_paths):
+        """
+        Destroy several filesystems in a pool with a single call
+        :param str pool_path: The object path of the pool which contains the filesystems
+        :param fs_paths: The object paths of the filesystems to destroy
+        :type fs_paths: list of str
+        :return: The return values of the DestroyFilesystems call
+        :rtype: The D-Bus types (bas), q, and s
+        """
+        iface = StratisDbus._interface(pool_path, StratisDbus._POOL_IFACE)
         return iface.DestroyFilesystems(fs_paths, timeout=StratisDbus._TIMEOUT)
 
     @staticmethod
@@ -613,48 +696,17 @@ class StratisDbus:
         :return: The return values of the SetName call, or None
         :rtype: The D-Bus types (bs), q, and s, or None
         """
-        objects = StratisDbus.get_managed_objects().items()
-
-        pool_objects = {
-            path: obj_data[StratisDbus._POOL_IFACE]
-            for path, obj_data in objects
-            if StratisDbus._POOL_IFACE in obj_data
-            and obj_data[StratisDbus._POOL_IFACE]["Name"].startswith(_TEST_PREF)
-        }
+        objects = StratisDbus.get_managed_objects()
 
-        pool_paths = [
-            path
-            for path, pool_obj in pool_objects.items()
-            if pool_obj["Name"] == pool_name
-        ]
-
-        if len(pool_paths) != 1:
+        pool_path = _pool_paths_by_name(objects).get(pool_name)
+        if pool_path is None:
             return None
 
-        pool_path = pool_paths[0]
-
-        fs_objects = {
-            path: obj_data[StratisDbus._FS_IFACE]
-            for path, obj_data in objects
-            if StratisDbus._FS_IFACE in obj_data
-            and obj_data[StratisDbus._FS_IFACE]["Name"].startswith(_TEST_PREF)
-        }
-
-        fs_paths = [
-            path
-            for path, fs_obj in fs_objects.items()
-            if fs_obj["Name"] == fs_name and fs_obj["Pool"] == pool_path
-        ]
-
-        if len(fs_paths) != 1:
+        fs_path = _fs_paths_by_name(objects).get((pool_path, fs_name))
+        if fs_path is None:
             return None
 
-        fs_path = fs_paths[0]
-
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, fs_path),
-            StratisDbus._FS_IFACE,
-        )
+        iface = StratisDbus._interface(fs_path, StratisDbus._FS_IFACE)
         return iface.SetName(fs_name_rename, timeout=StratisDbus._TIMEOUT)
 
     @staticmethod
@@ -667,10 +719,7 @@ class StratisDbus:
         :return: The return values of the SnapshotFilesystem call
         :rtype: The D-Bus types (bo), q, and s
         """
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, pool_path),
-            StratisDbus._POOL_IFACE,
-        )
+        iface = StratisDbus._interface(pool_path, StratisDbus._POOL_IFACE)
         return iface.SnapshotFilesystem(
             fs_path, snapshot_name, timeout=StratisDbus._TIMEOUT
         )
@@ -683,9 +732,8 @@ class StratisDbus:
         :return: The JSON report as a string with a status code and string
         :rtype: The D-Bus types s, q, and s
         """
-        iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, StratisDbus._TOP_OBJECT),
-            StratisDbus._REPORT_IFACE,
+        iface = StratisDbus._interface(
+            StratisDbus._TOP_OBJECT, StratisDbus._REPORT_IFACE
         )
         return iface.GetReport(report_name, timeout=StratisDbus._TIMEOUT)
 
@@ -696,16 +744,20 @@ class StratisDbus:
         :return: The JSON report as a string with a status code and string
         :rtype: The D-Bus types s, q, and s
         """
-        manager_iface = dbus.Interface(
-            StratisDbus._BUS.get_object(StratisDbus._BUS_NAME, StratisDbus._TOP_OBJECT),
-            StratisDbus._MNGR_IFACE,
+        manager_iface = StratisDbus._interface(
+            StratisDbus._TOP_OBJECT, StratisDbus._MNGR_IFACE
         )
         return manager_iface.EngineStateReport(timeout=StratisDbus._TIMEOUT)
 
     @staticmethod
     def reconnect():
         """
-        Close and reopen bus connection.
+        Close and reopen bus connection, dropping everything cached from
+        the old connection.
         """
         StratisDbus._BUS.close()
-        StratisDbus._BUS = dbus.SystemBus()
+        StratisDbus._BUS = dbus.SystemBus(private=True)
+        StratisDbus._owner = None
+        StratisDbus._proxies = {}
+        StratisDbus._interfaces = {}
+        StratisDbus._managed_objects_cache = None
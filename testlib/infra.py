@@ -26,19 +26,19 @@ import tempfile
 import time
 import unittest
 from enum import Enum
-from tempfile import NamedTemporaryFile
 
 # isort: THIRDPARTY
 import dbus
 from justbytes import Range
 
-from .dbus import StratisDbus, manager_interfaces
+from .dbus import StratisDbus, manager_interfaces, test_objects
 from .utils import exec_command, process_exists, terminate_traces
 
 _OK = 0
 
 MONITOR_DBUS_SIGNALS = "./scripts/monitor_dbus_signals.py"
 DBUS_NAME_HAS_NO_OWNER_ERROR = "org.freedesktop.DBus.Error.NameHasNoOwner"
+DBUS_SERVICE_UNKNOWN_ERROR = "org.freedesktop.DBus.Error.ServiceUnknown"
 SYS_CLASS_BLOCK = "/sys/class/block"
 DEV_MAPPER = "/dev/mapper"
 VAR_TMP = "/var/tmp"
@@ -48,7 +48,7 @@ MOUNT = "mount"
 STRATIS_METADATA_LEN = Range(8192, 512)
 
 
-def clean_up():  # pylint: disable=too-many-branches,too-many-locals
+def clean_up():  # pylint: disable=too-many-branches,too-many-locals,too-many-statements
     """
     Try to clean up after a test failure.
 
@@ -76,44 +76,64 @@ def clean_up():  # pylint: disable=too-many-branches,too-many-locals
     for uuid in StratisDbus.stopped_pools():
         StratisDbus.pool_start(uuid, "uuid")
 
-    # Unmount FS
-    for mountpoint_dir in fnmatch.filter(os.listdir(VAR_TMP), f"*{MOUNT_POINT_SUFFIX}"):
-        for (_, name, _), _ in StratisDbus.fs_list().items():
+    mountpoint_dirs = fnmatch.filter(os.listdir(VAR_TMP), f"*{MOUNT_POINT_SUFFIX}")
+
+    # None of the filesystem operations below adds or removes an object that
+    # a later one looks up, so they can all use one snapshot of the objects.
+    with StratisDbus.cached_managed_objects() as objects:
+        filesystems = StratisDbus.fs_list()
+
+        # Unmount FS, with one umount invocation per mountpoint dir
+        for mountpoint_dir in mountpoint_dirs:
+            mountpoints = [
+                os.path.join(VAR_TMP, mountpoint_dir, name)
+                for _, name, _ in filesystems
+            ]
+            if mountpoints == []:
+                continue
             try:
-                subprocess.check_call(
-                    [UMOUNT, os.path.join(VAR_TMP, mountpoint_dir, name)]
-                )
+                subprocess.check_call([UMOUNT] + mountpoints)
             except subprocess.CalledProcessError as err:
                 error_strings.append(
-                    "Failed to umount filesystem at "
-                    f"{os.path.join(VAR_TMP, mountpoint_dir, name)}: {err}"
+                    f'Failed to umount filesystems at {", ".join(mountpoints)}: {err}'
+                )
+
+        # Unset MergeScheduled
+        for (fs_path, name, (origin_set, _)), pool_name in filesystems.items():
+            if origin_set:
+                check_result(
+                    StratisDbus.set_property(
+                        fs_path,
+                        StratisDbus.FS_IFACE,
+                        "MergeScheduled",
+                        dbus.Boolean(False),
+                    ),
+                    "failed to set MergeScheduled to False",
+                    (name, pool_name),
                 )
 
-    # Unset MergeScheduled
-    for (fs_path, name, (origin_set, _)), pool_name in StratisDbus.fs_list().items():
-        if origin_set:
+        # Remove FS
+        pool_names_by_path = {path: name for path, name, _ in StratisDbus.pool_list()}
+        fs_by_pool = {}
+        for fs_path, props in test_objects(objects, StratisDbus.FS_IFACE):
+            fs_by_pool.setdefault(props["Pool"], []).append((fs_path, props["Name"]))
+        for pool_path, fs_entries in fs_by_pool.items():
             check_result(
-                StratisDbus.set_property(
-                    fs_path,
-                    StratisDbus.FS_IFACE,
-                    "MergeScheduled",
-                    dbus.Boolean(False),
+                StratisDbus.fs_destroy_many(
+                    pool_path, [fs_path for fs_path, _ in fs_entries]
+                ),
+                "failed to destroy filesystems %s in pool %s",
+                (
+                    ", ".join(name for _, name in fs_entries),
+                    pool_names_by_path.get(pool_path, pool_path),
                 ),
-                "failed to set MergeScheduled to False",
-                (name, pool_name),
             )
 
-    # Remove FS
-    for (_, name, _), pool_name in StratisDbus.fs_list().items():
-        check_result(
-            StratisDbus.fs_destroy(pool_name, name),
-            "failed to destroy filesystem %s in pool %s",
-            (name, pool_name),
-        )
-
     # Remove Pools
-    for _, name, _ in StratisDbus.pool_list():
-        check_result(StratisDbus.pool_destroy(name), "failed to destroy pool %s", name)
+    with StratisDbus.cached_managed_objects():
+        pool_names = [name for _, name, _ in StratisDbus.pool_list()]
+        for name, result in StratisDbus.pool_destroy_many(pool_names).items():
+            check_result(result, "failed to destroy pool %s", name)
 
     # Unset all Stratis keys
     (keys, return_code, message) = StratisDbus.get_keys()
@@ -126,30 +146,37 @@ def clean_up():  # pylint: disable=too-many-branches,too-many-locals
         check_result(StratisDbus.unset_key(key), "failed to unset key %s", key)
 
     # Report an error if any filesystems, pools or keys are found to be
-    # still in residence
-    remnant_filesystems = StratisDbus.fs_list()
-    if remnant_filesystems != {}:
-        error_strings.append(
-            f"remnant filesystems: "
-            f'{", ".join(map(lambda x: f"{x[0]} in pool {x[1]}", remnant_filesystems.items(),))}'
-        )
+    # still in residence; if there were none to remove, there is no need to
+    # look again.
+    if filesystems or pool_names or keys:
+        with StratisDbus.cached_managed_objects():
+            remnant_filesystems = StratisDbus.fs_list()
+            remnant_pools = StratisDbus.pool_list()
+
+        if remnant_filesystems != {}:
+            error_strings.append(
+                "remnant filesystems: "
+                + ", ".join(
+                    f"{fs_key} in pool {pool_name}"
+                    for fs_key, pool_name in remnant_filesystems.items()
+                )
+            )
 
-    remnant_pools = StratisDbus.pool_list()
-    if remnant_pools != []:
-        error_strings.append(
-            f'remnant pools: {", ".join(name for _, name, _ in remnant_pools)}'
-        )
+        if remnant_pools != []:
+            error_strings.append(
+                f'remnant pools: {", ".join(name for _, name, _ in remnant_pools)}'
+            )
 
-    (remnant_keys, return_code, message) = StratisDbus.get_keys()
-    if return_code != _OK:
-        error_strings.append(
-            f"failed to obtain information about Stratis keys: {message}"
-        )
-    else:
-        if remnant_keys != []:
-            error_strings.append(f'remnant keys: {", ".join(remnant_keys)}')
+        (remnant_keys, return_code, message) = StratisDbus.get_keys()
+        if return_code != _OK:
+            error_strings.append(
+                f"failed to obtain information about Stratis keys: {message}"
+            )
+        else:
+            if remnant_keys != []:
+                error_strings.append(f'remnant keys: {", ".join(remnant_keys)}')
 
-    for mountpoint_dir in fnmatch.filter(os.listdir(VAR_TMP), f"*{MOUNT_POINT_SUFFIX}"):
+    for mountpoint_dir in mountpoint_dirs:
         try:
             shutil.rmtree(os.path.join(VAR_TMP, mountpoint_dir))
         except Exception as err:  # pylint: disable=broad-exception-caught
@@ -164,6 +191,32 @@ def clean_up():  # pylint: disable=too-many-branches,too-many-locals
         )
 
 
+def _wait_for_stratisd(timeout, interval=0.1):
+    """
+    Wait until stratisd answers on the D-Bus, it exits, or timeout seconds
+    have passed, whichever comes first.
+
+    :param float timeout: the longest time to wait, in seconds
+    :param float interval: the time between attempts, in seconds
+    :return: None
+    """
+    deadline = time.monotonic() + timeout
+    while process_exists("stratisd") is not None:
+        try:
+            StratisDbus.stratisd_version()
+            return
+        except dbus.exceptions.DBusException as err:
+            if err.get_dbus_name() not in (
+                DBUS_NAME_HAS_NO_OWNER_ERROR,
+                DBUS_SERVICE_UNKNOWN_ERROR,
+            ):
+                return
+
+        if time.monotonic() >= deadline:
+            return
+        time.sleep(interval)
+
+
 class StratisdSystemdStart(unittest.TestCase):
     """
     Handles starting and stopping stratisd via systemd.
@@ -184,7 +237,7 @@ class StratisdSystemdStart(unittest.TestCase):
 
         if process_exists("stratisd") is None:
             exec_command(["systemctl", "start", "stratisd"])
-            time.sleep(20)
+            _wait_for_stratisd(20)
 
         if process_exists("stratisd") is None:
             raise RuntimeError(
@@ -284,32 +337,29 @@ class PoolMetadataMonitor(unittest.TestCase):
 
                     self._check_encryption_information_consistency(object_path, written)
 
-                    with NamedTemporaryFile(mode="w") as temp_file:
-                        temp_file.write(json.dumps(written))
-                        temp_file.flush()
-
-                        try:
-                            with subprocess.Popen(
-                                [
-                                    stratisd_tools,
-                                    "stratis-checkmetadata",
-                                    temp_file.name,
-                                ],
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                            ) as proc:
-                                (stdoutdata, stderrdata) = proc.communicate()
-                                self.assertEqual(
-                                    proc.returncode,
-                                    0,
-                                    (
-                                        f'stdout: {stdoutdata.decode("utf-8")}'
-                                        "; "
-                                        f'stderr: {stderrdata.decode("utf-8")}'
-                                    ),
-                                )
-                        except FileNotFoundError as err:
-                            raise RuntimeError(f"{stratisd_tools} not found") from err
+                    # stratis-checkmetadata takes a file name, so have it
+                    # read the metadata from its stdin.
+                    try:
+                        with subprocess.Popen(
+                            [stratisd_tools, "stratis-checkmetadata", "/dev/stdin"],
+                            stdin=subprocess.PIPE,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE,
+                        ) as proc:
+                            (stdoutdata, stderrdata) = proc.communicate(
+                                json.dumps(written).encode("utf-8")
+                            )
+                            self.assertEqual(
+                                proc.returncode,
+                                0,
+                                (
+                                    f'stdout: {stdoutdata.decode("utf-8")}'
+                                    "; "
+                                    f'stderr: {stderrdata.decode("utf-8")}'
+                                ),
+                            )
+                    except FileNotFoundError as err:
+                        raise RuntimeError(f"{stratisd_tools} not found") from err
 
                 else:
                     current_message = (
@@ -339,15 +389,8 @@ class SysfsMonitor(unittest.TestCase):
         Run the check.
         """
         if SysfsMonitor.verify_sysfs:  # pylint: disable=no-member
-            dm_devices = {
-                os.path.basename(
-                    os.path.realpath(os.path.join(DEV_MAPPER, dmdev))
-                ): dmdev
-                for dmdev in os.listdir(DEV_MAPPER)
-            }
-
+            misaligned = []
             try:
-                misaligned_devices = []
                 for dev in fnmatch.filter(os.listdir(SYS_CLASS_BLOCK), "dm-*"):
                     dev_sysfspath = os.path.join(
                         SYS_CLASS_BLOCK, dev, "alignment_offset"
@@ -355,16 +398,27 @@ class SysfsMonitor(unittest.TestCase):
                     with open(dev_sysfspath, "r", encoding="utf-8") as dev_sysfs:
                         dev_align = dev_sysfs.read().rstrip()
                         if int(dev_align) != 0:
-                            misaligned_devices.append(
-                                f"Stratis Name: {dm_devices[dev]}, "
-                                f" DM name: {dev}, "
-                                f" Alignment offset: {dev_align}"
-                            )
-
-                self.assertEqual(misaligned_devices, [])
+                            misaligned.append((dev, dev_align))
             except FileNotFoundError:
                 pass
 
+            # Device mapper names are only needed to describe misaligned
+            # devices, and usually there are none.
+            if misaligned:
+                dm_devices = {
+                    os.path.basename(
+                        os.path.realpath(os.path.join(DEV_MAPPER, dmdev))
+                    ): dmdev
+                    for dmdev in os.listdir(DEV_MAPPER)
+                }
+                misaligned_devices = [
+                    f"Stratis Name: {dm_devices.get(dev, dev)}, "
+                    f" DM name: {dev}, "
+                    f" Alignment offset: {dev_align}"
+                    for (dev, dev_align) in misaligned
+                ]
+                self.assertEqual(misaligned_devices, [])
+
 
 class SymlinkMonitor(unittest.TestCase):
     """
@@ -567,7 +621,7 @@ class KernelKey:  # pylint: disable=attribute-defined-outside-init
     def __init__(self, key_data):
         """
         Initialize a key with the provided key data (passphrase).
-        :param bytes key_data: The desired key contents
+        :param str key_data: The desired key contents
         """
         self._key_data = key_data
 
@@ -579,14 +633,16 @@ class KernelKey:  # pylint: disable=attribute-defined-outside-init
         :raises RuntimeError: if setting the key using the stratisd D-Bus API
                               returns a non-zero return code
         """
-        with open("/dev/urandom", "rb") as urandom_f:
-            self._key_desc = base64.b64encode(urandom_f.read(16)).decode("utf-8")
+        self._key_desc = base64.b64encode(os.urandom(16)).decode("utf-8")
 
-        with NamedTemporaryFile(mode="w") as temp_file:
-            temp_file.write(self._key_data)
-            temp_file.flush()
+        key_fd = os.memfd_create("stratis-key", os.MFD_CLOEXEC)
+        try:
+            os.write(key_fd, self._key_data.encode("utf-8"))
+            os.lseek(key_fd, 0, os.SEEK_SET)
 
-            (_, return_code, message) = StratisDbus.set_key(self._key_desc, temp_file)
+            (_, return_code, message) = StratisDbus.set_key(self._key_desc, key_fd)
+        finally:
+            os.close(key_fd)
 
         if return_code != _OK:
             raise RuntimeError(
@@ -19,7 +19,7 @@ import os
 import random
 import string
 from functools import wraps
-from subprocess import PIPE, Popen, run
+from subprocess import PIPE, run
 from tempfile import NamedTemporaryFile
 
 # isort: THIRDPARTY
@@ -32,7 +32,7 @@ def random_string(length=4):
     :param length: Length of random string
     :return: String
     """
-    return "".join(random.choice(string.ascii_uppercase) for _ in range(length))
+    return "".join(random.choices(string.ascii_uppercase, k=length))
 
 
 def revision_number_type(revision_number):
@@ -69,12 +69,11 @@ def process_exists(name):
     :return: pid or None
     :rtype: int or NoneType
     """
+    # process_iter has already read each name into proc.info, skipping any
+    # process which has exited, so there is no need to read it again.
     for proc in psutil.process_iter(["name"]):
-        try:
-            if proc.name() == name:
-                return proc.pid
-        except psutil.NoSuchProcess:
-            pass
+        if proc.info["name"] == name:
+            return proc.pid
 
     return None
 
@@ -83,16 +82,26 @@ def terminate_traces(name):
     """
     Terminate trace processes with the given filename.  This is
     intended for Python scripts whose name will be in the cmdline, but
-    not in the process name.
+    not in the process name. Any which have not exited a few seconds
+    after being terminated are killed.
     :param name: name of script to clean up
     :type name: str
     return: None
     """
+    terminated = []
     for proc in psutil.process_iter(["cmdline"]):
         try:
             cmdline = proc.info["cmdline"]
-            if cmdline is not None and any(name == param for param in cmdline):
+            if cmdline is not None and name in cmdline:
                 proc.terminate()
+                terminated.append(proc)
+        except psutil.NoSuchProcess:
+            pass
+
+    (_, alive) = psutil.wait_procs(terminated, timeout=3)
+    for proc in alive:
+        try:
+            proc.kill()
         except psutil.NoSuchProcess:
             pass
 
@@ -132,15 +141,12 @@ def exec_test_command(cmd, *, settle=False):
     if settle:
         run(["udevadm", "settle"], check=True)
 
-    with Popen(
-        cmd, stdout=PIPE, stderr=PIPE, close_fds=True, env=os.environ
-    ) as process:
-        result = process.communicate()
-        return (
-            process.returncode,
-            bytes(result[0]).decode("utf-8"),
-            bytes(result[1]).decode("utf-8"),
-        )
+    result = run(cmd, stdout=PIPE, stderr=PIPE, close_fds=True, check=False)
+    return (
+        result.returncode,
+        result.stdout.decode("utf-8"),
+        result.stderr.decode("utf-8"),
+    )
 
 
 class RandomKeyTmpFile:
@@ -155,11 +161,8 @@ class RandomKeyTmpFile:
 
         :param int key_bytes: the desired length of the key in bytes
         """
-        self._tmpfile = NamedTemporaryFile("wb")
-        with open("/dev/urandom", "rb") as urandom_f:
-            random_bytes = urandom_f.read(key_bytes)
-            self._tmpfile.write(random_bytes)
-            self._tmpfile.flush()
+        self._tmpfile = NamedTemporaryFile("wb", buffering=0)
+        self._tmpfile.write(os.urandom(key_bytes))
 
     def tmpfile_name(self):
         """